@@ -0,0 +1,60 @@
+# app/celery_app.py
+import asyncio
+import logging
+import uuid
+from .config import settings
+from .services import evaluate_bulk, close_resources
+
+try:
+    from celery import Celery
+except ImportError:  # celery is optional; only needed for background ranking jobs
+    Celery = None
+
+# Background ranking runs only when a broker is configured
+celery_app = (
+    Celery("screener", broker=settings.REDIS_URL, backend=settings.REDIS_URL)
+    if Celery is not None and settings.REDIS_URL
+    else None
+)
+if celery_app is not None:
+    celery_app.conf.result_expires = settings.JOB_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Celery reports unknown task ids as PENDING, so submitted ids are recorded here
+_JOB_KEY_PREFIX = "screener:job:"
+
+async def _rank(items):
+    try:
+        return await evaluate_bulk(items)
+    finally:
+        # each task runs in a fresh event loop; drop loop-bound clients afterwards
+        await close_resources()
+
+def rank_items(items, top_k=None):
+    """
+    items: list of [id, text] (JSON round-trips tuples as lists)
+    Returns {"top_k": top_k, "rows": [...]}, rows being dicts with keys:
+    id, text, score, summary, improvement
+    """
+    items = [(cid, text) for (cid, text) in items]
+    try:
+        results = asyncio.run(_rank(items))
+    except Exception:
+        # details stay in the worker log; the API only reports that the job failed
+        logger.exception("ranking job failed (%d candidates)", len(items))
+        raise
+    rows = [{"id": cid, "text": text, **res} for ((cid, text), res) in zip(items, results)]
+    return {"top_k": top_k, "rows": rows}
+
+rank_task = celery_app.task(name="screener.rank")(rank_items) if celery_app is not None else None
+
+def submit_rank_job(items, top_k=None) -> str:
+    job_id = str(uuid.uuid4())
+    # mark the id as known before the worker can see it, for as long as its result lives
+    celery_app.backend.client.set(_JOB_KEY_PREFIX + job_id, 1, ex=settings.JOB_TTL_SECONDS)
+    rank_task.apply_async(args=(items, top_k), task_id=job_id)
+    return job_id
+
+def job_exists(job_id: str) -> bool:
+    return bool(celery_app.backend.client.exists(_JOB_KEY_PREFIX + job_id))
@@ -9,6 +9,15 @@ class Settings:
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     OPENAI_API_BASE = os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
     USE_FALLBACK = os.getenv("USE_FALLBACK", "").lower() in ("1", "true") or not OPENAI_API_KEY
+    MIN_LLM_CHARS = int(os.getenv("MIN_LLM_CHARS", "20"))
+    HTTPX_MAX_CONNECTIONS = int(os.getenv("HTTPX_MAX_CONNECTIONS", "100"))
+    HTTPX_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTPX_MAX_KEEPALIVE_CONNECTIONS", "40"))
+    CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "4096"))
+    CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "3600"))
+    BULK_CONCURRENCY = int(os.getenv("BULK_CONCURRENCY", "20"))
+    OPENAI_BATCH_SIZE = int(os.getenv("OPENAI_BATCH_SIZE", "8"))
+    REDIS_URL = os.getenv("REDIS_URL", "").strip()
+    JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", "86400"))
 
 settings = Settings()
 
@@ -1,20 +1,60 @@
 # app/main.py
 import asyncio
+import heapq
+import logging
+import orjson
+from operator import itemgetter
 from fastapi import FastAPI, HTTPException
-from typing import List
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse
+from typing import Any, Dict, List
 from .schemas import (
     EvaluateRequest, EvaluateResponse,
-    CandidateIn, RankRequest, RankResponse, RankedCandidate
+    CandidateIn, RankRequest, RankResponse, RankJob
 )
-from .services import evaluate_text, evaluate_bulk
+from .services import evaluate_text, evaluate_bulk, evaluate_bulk_iter, get_client, close_resources, cache_stats
 from .config import settings
+from .celery_app import celery_app, submit_rank_job, job_exists
+
+# uvicorn only configures its own loggers; this one is printed at INFO
+logger = logging.getLogger("uvicorn.error")
 
 app = FastAPI(title="Mini AI Interview Screener (backend)")
+class _GZipExceptStreams(GZipMiddleware):
+    """
+    GZipMiddleware that leaves NDJSON streams alone: older Starlette releases
+    never flush the compressor per chunk, which would hold every line until the end.
+    """
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in _UNCOMPRESSED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+_UNCOMPRESSED_PATHS = {"/rank-candidates/stream"}
+
+# ranking payloads are repetitive English prose and compress well
+app.add_middleware(_GZipExceptStreams, minimum_size=1024, compresslevel=5)
+
+@app.on_event("startup")
+async def startup():
+    # expect uvloop.Loop when started with --loop uvloop
+    logger.info("event loop: %s", type(asyncio.get_running_loop()).__name__)
+    if not settings.USE_FALLBACK:
+        get_client()
+
+@app.on_event("shutdown")
+async def shutdown():
+    await close_resources()
 
 @app.get("/")
 async def root():
     return {"ok": True, "provider": "fallback" if settings.USE_FALLBACK else "openai"}
 
+@app.get("/cache-stats")
+async def get_cache_stats():
+    return cache_stats()
+
 @app.post("/evaluate-answer", response_model=EvaluateResponse)
 async def evaluate_answer(req: EvaluateRequest):
     """
@@ -27,7 +67,7 @@ async def evaluate_answer(req: EvaluateRequest):
     return EvaluateResponse(**result)
 
 @app.post("/rank-candidates", response_model=RankResponse)
-async def rank_candidates(req: RankRequest):
+async def rank_candidates(req: RankRequest, include_text: bool = False):
     """
     Input:
     {
@@ -36,7 +76,9 @@ async def rank_candidates(req: RankRequest):
         {"id": "c2", "text": "Candidate says: ..."}
       ]
     }
-    Output: ranked list (highest score first)
+    Optional "top_k": N keeps only the N best candidates.
+    Output: ranked list (highest score first) of id/score/summary/improvement;
+    pass ?include_text=1 to also echo each candidate's text.
     """
     if not req.candidates:
         raise HTTPException(status_code=400, detail="No candidates provided")
@@ -47,19 +89,99 @@ async def rank_candidates(req: RankRequest):
     # Evaluate concurrently
     results = await evaluate_bulk(items)  # list of dicts corresponding to items
 
+    return _json_response(_build_ranking(items, results, req.top_k, include_text))
+
+def _json_response(content, status_code: int = 200) -> Response:
+    # bypasses response_model validation; orjson encodes the already-built payload
+    return Response(orjson.dumps(content), status_code=status_code, media_type="application/json")
+
+def _ranking_row(cid, text, res, include_text=False) -> Dict[str, Any]:
+    row = {
+        "id": cid,
+        "score": int(res["score"]),
+        "summary": res["summary"],
+        "improvement": res["improvement"],
+    }
+    if include_text:
+        row["text"] = text
+    return row
+
+def _build_ranking(items, results, top_k=None, include_text=False) -> Dict[str, Any]:
+    """
+    Returns a RankResponse-shaped dict. The rows are built from already
+    normalized evaluation results, so they skip pydantic validation and are
+    serialized straight to JSON by the caller.
+    """
     # Build ranked candidates
     ranked_objs = []
     for (item, res) in zip(items, results):
         cid, text = item
-        ranked_objs.append(RankedCandidate(
-            id=cid,
-            text=text,
-            score=int(res["score"]),
-            summary=res["summary"],
-            improvement=res["improvement"]
-        ))
-
-    # Sort by score desc, tie-breaker by longer summary (arbitrary)
-    ranked_sorted = sorted(ranked_objs, key=lambda x: (-x.score, -len(x.summary)))
-
-    return RankResponse(ranked=ranked_sorted)
+        ranked_objs.append(_ranking_row(cid, text, res, include_text))
+
+    # Sort by score desc, tie-breaker by longer summary (arbitrary).
+    # Keys are computed once; for top_k a heap avoids sorting the whole pool.
+    decorated = [((r["score"], len(r["summary"])), r) for r in ranked_objs]
+    if top_k is not None and top_k < len(decorated):
+        top = heapq.nlargest(top_k, decorated, key=itemgetter(0))
+    else:
+        top = sorted(decorated, key=itemgetter(0), reverse=True)
+    ranked_sorted = [r for (_key, r) in top]
+
+    return {"ranked": ranked_sorted}
+
+@app.post("/rank-candidates/stream")
+async def rank_candidates_stream(req: RankRequest, include_text: bool = False):
+    """
+    Same input as /rank-candidates, but streams NDJSON: one RankedCandidateSlim
+    (or RankedCandidate with ?include_text=1) per line, in completion order.
+    The client sorts; top_k is ignored since the best N are only known at the end.
+    Sent uncompressed so each line reaches the client as soon as it is written.
+    """
+    if not req.candidates:
+        raise HTTPException(status_code=400, detail="No candidates provided")
+
+    items = [(c.id, c.text) for c in req.candidates]
+
+    async def gen():
+        async for i, res in evaluate_bulk_iter(items):
+            cid, text = items[i]
+            yield orjson.dumps(_ranking_row(cid, text, res, include_text)) + b"\n"
+
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
+
+# -------------------------
+# Background ranking (Celery + Redis, enabled via REDIS_URL)
+# -------------------------
+def _require_queue():
+    if celery_app is None:
+        raise HTTPException(status_code=503, detail="Background ranking not configured (set REDIS_URL and install celery)")
+
+@app.post("/rank-candidates/jobs", response_model=RankJob, status_code=202)
+def create_rank_job(req: RankRequest):
+    """
+    Same input as /rank-candidates, but returns immediately with a job id.
+    Poll GET /rank-candidates/{job_id} for the ranked list.
+    """
+    _require_queue()
+    if not req.candidates:
+        raise HTTPException(status_code=400, detail="No candidates provided")
+    job_id = submit_rank_job([(c.id, c.text) for c in req.candidates], req.top_k)
+    return RankJob(job_id=job_id, status="PENDING")
+
+@app.get("/rank-candidates/{job_id}", response_model=RankResponse, responses={202: {"model": RankJob}})
+def get_rank_job(job_id: str, include_text: bool = False):
+    """
+    Returns the ranked list once the job is done, otherwise 202 with its status.
+    404 for ids that were never submitted or whose result has expired.
+    """
+    _require_queue()
+    if not job_exists(job_id):
+        raise HTTPException(status_code=404, detail="Unknown or expired job id")
+    job = celery_app.AsyncResult(job_id)
+    if job.failed():
+        raise HTTPException(status_code=500, detail=f"Ranking job {job_id} failed")
+    if not job.ready():
+        return _json_response({"job_id": job_id, "status": job.state}, status_code=202)
+    rows = job.result["rows"]
+    items = [(r["id"], r["text"]) for r in rows]
+    return _json_response(_build_ranking(items, rows, job.result["top_k"], include_text))
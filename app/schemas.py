@@ -1,6 +1,6 @@
 # app/schemas.py
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional, Union
 
 class EvaluateRequest(BaseModel):
     # Accepts either raw answer or full text "Candidate says: ..."
@@ -17,13 +17,23 @@ class CandidateIn(BaseModel):
 
 class RankRequest(BaseModel):
     candidates: List[CandidateIn]
+    # only return the best top_k candidates (all when omitted)
+    top_k: Optional[int] = Field(default=None, ge=1)
 
-class RankedCandidate(BaseModel):
+class RankedCandidateSlim(BaseModel):
+    # default ranking row: the caller already has the text keyed by id
     id: Optional[str] = None
-    text: str
     score: int
     summary: str
     improvement: str
 
+class RankedCandidate(RankedCandidateSlim):
+    # returned with ?include_text=1
+    text: str
+
 class RankResponse(BaseModel):
-    ranked: List[RankedCandidate]
+    ranked: List[Union[RankedCandidate, RankedCandidateSlim]]
+
+class RankJob(BaseModel):
+    job_id: str
+    status: str